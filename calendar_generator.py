@@ -37,35 +37,157 @@
 #   (https://github.com/screwyscrew/calendar_generator)
 #
 import os
+import sys
 import json
-import requests
+import time
 import calendar
-import datetime
-import textwrap
+from concurrent.futures import ProcessPoolExecutor
+
+# 祝日 API 用のセッション (リトライ時も同じ接続を使い回す。_get_session() で初回に作成)
+_SESSION = None
+
+# 祝日データのディスクキャッシュ (有効期限 24 時間)
+_HOLIDAYS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache",
+                                    "calendar_generator", "holidays-jp.json")
+_HOLIDAYS_CACHE_TTL = 24 * 60 * 60
+
+# 日曜始まりのカレンダー (状態を持たないので使い回す)
+_CAL = calendar.Calendar(firstweekday=6)
+
+# 曜日ごとの文字色 (日曜始まり。祝日は曜日に関係なく orangered)
+_WDAY_COLOR = ("orangered",) + ("black",) * 5 + ("royalblue",)
+_WDAY_COLOR_MINI = ("orangered",) + ("darkslategray",) * 5 + ("royalblue",)
+
+# SVG 断片のテンプレート (1 要素 1 行。座標・サイズは整数なので %d)
+_SVG_HEADER_TMPL = ('<svg width="%dmm" height="%dmm" viewBox="0 0 %d %d"'
+                    ' xmlns="http://www.w3.org/2000/svg"'
+                    ' xmlns:xlink="http://www.w3.org/1999/xlink" version="1.1">\n')
+
+_IMAGE_TMPL = '<image x="%d" y="%d" width="%d" height="%d" xlink:href="%s"/>\n'
+
+# 月の表示 (メイン・ミニ共通)
+_MONTH_TEXT_TMPL = ('<text x="%d" y="%d" font-family="Franklin Gothic Medium Cond" font-size="%d"'
+                    ' text-anchor="middle" dominant-baseline="text-after-edge">%d</text>\n')
+
+_WDAY_TMPL = ('<text x="%d" y="%d" font-size="%d" font-family="Franklin Gothic Medium Cond" fill="%s"'
+              ' text-anchor="middle" dominant-baseline="text-after-edge">%s</text>\n')
+
+_LINE_TMPL = '<line x1="%d" y1="%d" x2="%d" y2="%d" stroke="black" stroke-width="0.3"/>\n'
+
+# 日付の並び全体を囲むグループ (共通の属性は <g> から継承させる)
+# ※ SVG 1.1 では dominant-baseline は継承されないので、各 <text> に付ける
+_DAY_GROUP_OPEN = '<g font-family="Franklin Gothic Medium Cond" text-anchor="middle">\n'
+_GROUP_CLOSE = '</g>\n'
+
+# 日付 (メイン・ミニ共通。_DAY_GROUP_OPEN の中で使う)
+_DAY_TEXT_TMPL = ('<text x="%d" y="%d" font-size="%d" fill="%s"'
+                  ' dominant-baseline="text-after-edge">%d</text>\n')
+
+# 祝日名 (_DAY_GROUP_OPEN の中で使う)
+_HOLIDAY_TEXT_TMPL = ('<text x="%d" y="%d" font-size="%d" fill="orangered"'
+                      ' dominant-baseline="text-after-edge">%s</text>\n')
 
 def find_second_monday(year, month):
     """
     指定した年(year)・月(month)の第2月曜の日付(day)を返す。
     Python では weekday(): 月曜=0, 日曜=6
     """
-    d = datetime.date(year, month, 1)
-    offset = (7 - d.weekday()) % 7
-    first_monday = d + datetime.timedelta(days=offset)
-    second_monday = first_monday + datetime.timedelta(days=7)
-    return second_monday.day
+    offset = (7 - calendar.weekday(year, month, 1)) % 7
+    return 1 + offset + 7
+
+
+def _read_holidays_cache():
+    """
+    キャッシュ済みの祝日 JSON を返す。読めない・中身が dict でなければ None。
+    """
+    try:
+        with open(_HOLIDAYS_CACHE_PATH, encoding="utf-8") as f:
+            all_data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return all_data if isinstance(all_data, dict) else None
+
+
+def _write_holidays_cache(all_data):
+    """
+    祝日 JSON をキャッシュに保存する。失敗しても処理は続行する。
+    """
+    tmp_path = _HOLIDAYS_CACHE_PATH + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(_HOLIDAYS_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(all_data, f, ensure_ascii=False)
+        os.replace(tmp_path, _HOLIDAYS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _get_session():
+    """
+    祝日 API 用のセッションを返す。
+    requests の import は重いので、実際に通信するときまで遅らせる。
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                              max_retries=Retry(total=3, backoff_factor=0.3)))
+        _SESSION = session
+    return _SESSION
+
+
+def _fetch_holidays_json():
+    """
+    祝日 API の JSON ({ "YYYY-MM-DD": "祝日名", ... }) を返す。
+    24 時間以内のキャッシュがあれば通信せずにそれを使い、
+    通信に失敗した場合 (requests が無い場合を含む) は古いキャッシュで代用する。
+    """
+    try:
+        is_fresh = time.time() - os.path.getmtime(_HOLIDAYS_CACHE_PATH) < _HOLIDAYS_CACHE_TTL
+    except OSError:
+        is_fresh = False
+    if is_fresh:
+        all_data = _read_holidays_cache()
+        if all_data is not None:
+            return all_data
+
+    try:
+        import requests
+    except ImportError:
+        # requests が無い環境でも、古いキャッシュがあればそれを使う
+        all_data = _read_holidays_cache()
+        if all_data is None:
+            raise
+        return all_data
+
+    url = "https://holidays-jp.github.io/api/v1/date.json"
+    try:
+        resp = _get_session().get(url, timeout=10)
+        resp.raise_for_status()
+        all_data = resp.json()
+    except requests.RequestException:
+        all_data = _read_holidays_cache()
+        if all_data is None:
+            raise
+        return all_data
+
+    _write_holidays_cache(all_data)
+    return all_data
 
 
 def get_japanese_holidays_from_web(base_year):
     """
     base_year の祝日データを取得し、さらに「翌年1月」を13月として特別扱いで登録する。
     例: base_year=2025 → 通常の 2025年 の祝日データ + 特別仕様の「2026年1月」を (2025,13,day) に登録
+    キーは year * 10000 + month * 100 + day の整数 (例: 2025年13月12日 → 20251312)
     """
-    url = "https://holidays-jp.github.io/api/v1/date.json"
-    resp = requests.get(url)
-    resp.raise_for_status()
-    all_data = resp.json()  # { "YYYY-MM-DD": "祝日名", ... }
+    all_data = _fetch_holidays_json()  # { "YYYY-MM-DD": "祝日名", ... }
 
-    holiday_dict = {}  # {(year, month, day): 祝日名, ...}
+    holiday_dict = {}  # {year * 10000 + month * 100 + day: 祝日名, ...}
 
     # 1) base_year の祝日を取り込み
     for date_str, holiday_name in all_data.items():
@@ -75,13 +197,13 @@ def get_japanese_holidays_from_web(base_year):
             # "振替休日" の文字列が含まれていれば、holiday_name を強制的に "振替休日" にする
             if "振替休日" in holiday_name:
                 holiday_name = "振替休日"
-            holiday_dict[(y, m, d)] = holiday_name
+            holiday_dict[y * 10000 + m * 100 + d] = sys.intern(holiday_name)  # 同じ祝日名は同一オブジェクトに
 
     # 2) 翌年1月(=13月) の特別仕様
     next_year = base_year + 1
-    holiday_dict[(base_year, 13, 1)] = "元日"
+    holiday_dict[base_year * 10000 + 1300 + 1] = "元日"
     second_mon_day = find_second_monday(next_year, 1)
-    holiday_dict[(base_year, 13, second_mon_day)] = "成人の日"
+    holiday_dict[base_year * 10000 + 1300 + second_mon_day] = "成人の日"
 
     return holiday_dict
 
@@ -135,249 +257,173 @@ class CalendarSVGGenerator:
 
     DAY_OF_WEEK_LABELS = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
 
-    def __init__(self, year):
+    def __init__(self, year, holiday_dict=None):
+        """
+        holiday_dict を渡した場合は祝日データを取得せずにそれを使う。
+        """
         self.year = year
-        self.holiday_dict = get_japanese_holidays_from_web(self.year)
+        if holiday_dict is None:
+            holiday_dict = get_japanese_holidays_from_web(self.year)
+        self.holiday_dict = holiday_dict
+
+        # 毎月同じ内容になる断片は一度だけ組み立てておく
+        self._svg_header = self._get_svg_header()
+
+        # 曜日ラベル
+        self._dow_header = "".join(
+            _WDAY_TMPL % (self.MAIN_DAYOFWEEK_X + i * self.MAIN_COL_INTERVAL_X, self.MAIN_DAYOFWEEK_Y,
+                          self.FONT_SIZE_DAYOFWEEK_MAIN, _WDAY_COLOR[i], wday_label)
+            for i, wday_label in enumerate(self.DAY_OF_WEEK_LABELS)
+        )
+
+        # lineタグ (stroke-width="0.3" に変更)
+        self._line_tag = _LINE_TMPL % (self.DAYOFWEEK_LINE_START + self.DAYOFWEEK_LINE_END)
+
+        # 月ごとの「実際の年・月」と前後の月
+        self._actual = {m: self._interpret_month13(year, m) for m in range(1, 14)}
+        self._prev = {m: self._get_prev_month(year, m) for m in range(1, 14)}
+        self._next = {m: self._get_next_month(year, m) for m in range(1, 14)}
+
+        # 画像・SVG のファイル名に使う "YYMM" (13月は翌年1月)
+        self._yymm = {m: f"{y % 100:02d}{am:02d}" for m, (y, am) in self._actual.items()}
 
     def _get_svg_header(self):
         # 【変更 2】 text-before-edge → text-after-edge (あとで <text> の中に適用)
-        return textwrap.dedent(f"""\
-            <svg
-                width="{self.A3_WIDTH_MM}mm"
-                height="{self.A3_HEIGHT_MM}mm"
-                viewBox="0 0 {self.A3_WIDTH_MM} {self.A3_HEIGHT_MM}"
-                xmlns="http://www.w3.org/2000/svg"
-                xmlns:xlink="http://www.w3.org/1999/xlink"
-                version="1.1"
-            >
-        """)
+        return _SVG_HEADER_TMPL % (self.A3_WIDTH_MM, self.A3_HEIGHT_MM,
+                                   self.A3_WIDTH_MM, self.A3_HEIGHT_MM)
 
     def _get_svg_footer(self):
         return "</svg>"
 
-    def _generate_calendar_svg(self, month):
-        svg_parts = []
-        svg_parts.append(self._get_svg_header())
+    def _generate_calendar_svg(self, write, month):
+        """
+        month 月分の SVG 断片を順に write (例: ファイルの write) へ書き出す。
+        """
+        write(self._svg_header)
 
         # 実際の「年・月」に変換 (13月→翌年1月)
-        actual_year, actual_month = self._interpret_month13(self.year, month)
+        actual_year, actual_month = self._actual[month]
 
         # 画像ファイル名
-        if month == 13:
-            yymm = f"{(self.year + 1) % 100:02d}01"
-        else:
-            yymm = f"{self.year % 100:02d}{month:02d}"
-
-        jpg_filename = f"{yymm}.jpg"
-        image_tag = f"""
-            <image
-                x="{self.IMG_X}"
-                y="{self.IMG_Y}"
-                width="{self.IMG_SIZE}"
-                height="{self.IMG_SIZE}"
-                xlink:href="{jpg_filename}"
-            />
-        """
-        svg_parts.append(textwrap.dedent(image_tag))
+        jpg_filename = f"{self._yymm[month]}.jpg"
+        write(_IMAGE_TMPL % (self.IMG_X, self.IMG_Y,
+                             self.IMG_SIZE, self.IMG_SIZE, jpg_filename))
 
         # 月の表示 (ここでは month の値そのまま出している)
         month_to_show = month
         #month_to_show = actual_month  # ←もし実際の月を出したいならこちらにする
 
-        month_text = f"""
-            <text
-                x="{self.MAIN_MONTH_X}"
-                y="{self.MAIN_MONTH_Y}"
-                font-family="Franklin Gothic Medium Cond"
-                font-size="{self.FONT_SIZE_MONTH_MAIN}"
-                text-anchor="middle"
-                dominant-baseline="text-after-edge"
-            >{month_to_show}</text>
-        """
-        svg_parts.append(textwrap.dedent(month_text))
-
-        # 曜日ラベル
-        for i, wday_label in enumerate(self.DAY_OF_WEEK_LABELS):
-            x_pos = self.MAIN_DAYOFWEEK_X + i * self.MAIN_COL_INTERVAL_X
-            color = self._get_day_of_week_color(i)
-            wday_text = f"""
-                <text
-                    x="{x_pos}"
-                    y="{self.MAIN_DAYOFWEEK_Y}"
-                    font-size="{self.FONT_SIZE_DAYOFWEEK_MAIN}"
-                    font-family="Franklin Gothic Medium Cond"
-                    fill="{color}"
-                    text-anchor="middle"
-                    dominant-baseline="text-after-edge"
-                >{wday_label}</text>
-            """
-            svg_parts.append(textwrap.dedent(wday_text))
+        write(_MONTH_TEXT_TMPL % (self.MAIN_MONTH_X, self.MAIN_MONTH_Y,
+                                  self.FONT_SIZE_MONTH_MAIN, month_to_show))
 
-        # lineタグ (stroke-width="0.3" に変更)
-        line_tag = f"""
-            <line
-                x1="{self.DAYOFWEEK_LINE_START[0]}"
-                y1="{self.DAYOFWEEK_LINE_START[1]}"
-                x2="{self.DAYOFWEEK_LINE_END[0]}"
-                y2="{self.DAYOFWEEK_LINE_END[1]}"
-                stroke="black"
-                stroke-width="0.3"
-            />
-        """
-        svg_parts.append(textwrap.dedent(line_tag))
+        # 曜日ラベル・lineタグ (__init__ で組み立て済み)
+        write(self._dow_header)
+        write(self._line_tag)
 
         # 日付(メイン)
-        c = calendar.Calendar(firstweekday=6)
-        main_days = [d for d in c.itermonthdates(actual_year, actual_month) if d.month == actual_month]
-
-        def convert_sun_start(wk):
-            return (wk + 1) % 7
-
-        first_wday = convert_sun_start(datetime.date(actual_year, actual_month, 1).weekday())
-
-        for d in main_days:
-            dday = d.day
-            wday = convert_sun_start(d.weekday())
-            offset_days = (d - datetime.date(actual_year, actual_month, 1)).days
-            row = (offset_days + first_wday) // 7
-
-            x_pos = self.MAIN_DAY_X + wday * self.MAIN_COL_INTERVAL_X
-            y_pos = self.MAIN_DAY_Y + row * self.MAIN_ROW_INTERVAL_Y
-
-            color = self._get_day_color(wday, (self.year, month, dday), actual_year, actual_month, mini=False)
-
-            day_text = f"""
-                <text
-                    x="{x_pos}"
-                    y="{y_pos}"
-                    font-family="Franklin Gothic Medium Cond"
-                    font-size="{self.FONT_SIZE_DAY_MAIN}"
-                    fill="{color}"
-                    text-anchor="middle"
-                    dominant-baseline="text-after-edge"
-                >{dday}</text>
-            """
-            svg_parts.append(textwrap.dedent(day_text))
+        # ループ内で使う属性はローカル変数に束縛しておく
+        base_year = self.year
+        day_x = self.MAIN_DAY_X
+        day_y = self.MAIN_DAY_Y
+        col_iv = self.MAIN_COL_INTERVAL_X
+        row_iv = self.MAIN_ROW_INTERVAL_Y
+        font_size_day = self.FONT_SIZE_DAY_MAIN
+        font_size_holiday = self.FONT_SIZE_HOLIDAY_TEXT
+        holidays = self.holiday_dict
+        ym_key = base_year * 10000 + month * 100  # holiday_dict のキー (日を足して使う)
+
+        # 曜日は日曜=0 に変換して使う (calendar は月曜=0)
+        first_wday = (calendar.weekday(actual_year, actual_month, 1) + 1) % 7
+
+        write(_DAY_GROUP_OPEN)
+
+        # itermonthdays2 は月外の日を 0 で返すので読み飛ばす
+        for dday, wk in _CAL.itermonthdays2(actual_year, actual_month):
+            if dday == 0:
+                continue
+            wday = (wk + 1) % 7
+            row = (dday - 1 + first_wday) // 7
+
+            x_pos = day_x + wday * col_iv
+            y_pos = day_y + row * row_iv
+
+            ymd_key = ym_key + dday
+            color = "orangered" if ymd_key in holidays else _WDAY_COLOR[wday]
+
+            write(_DAY_TEXT_TMPL % (x_pos, y_pos, font_size_day, color, dday))
 
             # 祝日名
-            key3 = (self.year, month, dday)
-            if key3 in self.holiday_dict:
-                holiday_name = self.holiday_dict[key3]
-                holiday_text = f"""
-                    <text
-                        x="{x_pos}"
-                        y="{y_pos + 4}"
-                        font-family="Franklin Gothic Medium Cond"
-                        font-size="{self.FONT_SIZE_HOLIDAY_TEXT}"
-                        fill="orangered"
-                        text-anchor="middle"
-                        dominant-baseline="text-after-edge"
-                    >{holiday_name}</text>
-                """
-                svg_parts.append(textwrap.dedent(holiday_text))
+            if ymd_key in holidays:
+                holiday_name = holidays[ymd_key]
+                write(_HOLIDAY_TEXT_TMPL % (x_pos, y_pos + 4, font_size_holiday, holiday_name))
+
+        write(_GROUP_CLOSE)
 
         # 前後の月(ミニ)
-        prev_year, prev_month = self._get_prev_month(self.year, month)
-        next_year, next_month = self._get_next_month(self.year, month)
+        prev_year, prev_month = self._prev[month]
+        next_year, next_month = self._next[month]
 
-        svg_parts.append(self._get_mini_calendar(
+        self._get_mini_calendar(
+            write,
             base_year=prev_year,
             base_month=prev_month,
             month_text_pos=(self.PREV_MONTH_X, self.PREV_MONTH_Y),
             day_start_pos=(self.PREV_DAY_X, self.PREV_DAY_Y),
             col_interval=self.PREV_COL_INTERVAL_X,
             row_interval=self.PREV_ROW_INTERVAL_Y
-        ))
-        svg_parts.append(self._get_mini_calendar(
+        )
+        self._get_mini_calendar(
+            write,
             base_year=next_year,
             base_month=next_month,
             month_text_pos=(self.NEXT_MONTH_X, self.NEXT_MONTH_Y),
             day_start_pos=(self.NEXT_DAY_X, self.NEXT_DAY_Y),
             col_interval=self.NEXT_COL_INTERVAL_X,
             row_interval=self.NEXT_ROW_INTERVAL_Y
-        ))
+        )
 
-        svg_parts.append(self._get_svg_footer())
-        return "\n".join(svg_parts)
+        write(self._get_svg_footer())
 
-    def _get_mini_calendar(self, base_year, base_month, month_text_pos, day_start_pos,
+    def _get_mini_calendar(self, write, base_year, base_month, month_text_pos, day_start_pos,
                            col_interval, row_interval):
         """
         miniカレンダー用。 base_year, base_month が 13 なら翌年1月扱い。
+        SVG 断片は順に write へ書き出す。
         """
         (month_x, month_y) = month_text_pos
         (day_x, day_y) = day_start_pos
 
-        part_list = []
-
         # 実際の (year, month)
         actual_year, actual_month = self._interpret_month13(base_year, base_month)
 
         # 【変更 3】 ここで表示する月の文字列を {base_month} → {actual_month} に変更
         #  (前回までは base_month をそのまま表示していた)
-        month_label_text = f"""
-            <text
-                x="{month_x}"
-                y="{month_y}"
-                font-family="Franklin Gothic Medium Cond"
-                font-size="{self.FONT_SIZE_MONTH_MINI}"
-                text-anchor="middle"
-                dominant-baseline="text-after-edge"
-            >{actual_month}</text>
-        """
-        part_list.append(textwrap.dedent(month_label_text))
+        write(_MONTH_TEXT_TMPL % (month_x, month_y, self.FONT_SIZE_MONTH_MINI, actual_month))
 
-        c = calendar.Calendar(firstweekday=6)
-        mini_days = [d for d in c.itermonthdates(actual_year, actual_month) if d.month == actual_month]
+        # ループ内で使う属性はローカル変数に束縛しておく
+        font_size_day = self.FONT_SIZE_DAY_MINI
+        holidays = self.holiday_dict
+        ym_key = base_year * 10000 + base_month * 100  # holiday_dict のキー (日を足して使う)
 
-        def convert_sun_start(wk):
-            return (wk + 1) % 7
+        # 曜日は日曜=0 に変換して使う (calendar は月曜=0)
+        first_wday = (calendar.weekday(actual_year, actual_month, 1) + 1) % 7
 
-        first_wday = convert_sun_start(datetime.date(actual_year, actual_month, 1).weekday())
+        write(_DAY_GROUP_OPEN)
 
-        for d in mini_days:
-            dday = d.day
-            wday = convert_sun_start(d.weekday())
-            offset_days = (d - datetime.date(actual_year, actual_month, 1)).days
-            row = (offset_days + first_wday) // 7
+        # itermonthdays2 は月外の日を 0 で返すので読み飛ばす
+        for dday, wk in _CAL.itermonthdays2(actual_year, actual_month):
+            if dday == 0:
+                continue
+            wday = (wk + 1) % 7
+            row = (dday - 1 + first_wday) // 7
 
             x_pos = day_x + wday * col_interval
             y_pos = day_y + row * row_interval
 
-            color = self._get_day_color(wday, (base_year, base_month, dday), actual_year, actual_month, mini=True)
-            txt = f"""
-                <text
-                    x="{x_pos}"
-                    y="{y_pos}"
-                    font-family="Franklin Gothic Medium Cond"
-                    font-size="{self.FONT_SIZE_DAY_MINI}"
-                    fill="{color}"
-                    text-anchor="middle"
-                    dominant-baseline="text-after-edge"
-                >{dday}</text>
-            """
-            part_list.append(textwrap.dedent(txt))
-
-        return "\n".join(part_list)
-
-    def _get_day_of_week_color(self, wday_idx):
-        if wday_idx == 0:
-            return "orangered"
-        elif wday_idx == 6:
-            return "royalblue"
-        else:
-            return "black"
-
-    def _get_day_color(self, wday_idx, base_ymd, actual_year, actual_month, mini=False):
-        if base_ymd in self.holiday_dict:
-            return "orangered"
+            color = "orangered" if ym_key + dday in holidays else _WDAY_COLOR_MINI[wday]
+            write(_DAY_TEXT_TMPL % (x_pos, y_pos, font_size_day, color, dday))
 
-        if wday_idx == 0:
-            return "orangered"
-        elif wday_idx == 6:
-            return "royalblue"
-        else:
-            return "darkslategray" if mini else "black"
+        write(_GROUP_CLOSE)
 
     def _interpret_month13(self, base_year, base_month):
         if base_month == 13:
@@ -401,21 +447,46 @@ class CalendarSVGGenerator:
         else:
             return (year, month + 1)
 
-    def save_calendar_svgs(self, output_dir="."):
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+    def save_calendar_svgs(self, output_dir=".", require_image=False, max_workers=None):
+        """
+        require_image=True なら、画像 ({yymm}.jpg) が output_dir にある月だけ生成する。
+        max_workers を指定した場合のみ、月ごとに別プロセスで生成する (既定は逐次生成)。
+        """
+        os.makedirs(output_dir, exist_ok=True)
 
+        months = []
         for m in range(1, 13):
-            if m < 13:
-                yymm = f"{self.year % 100:02d}{m:02d}"
-            else:
-                yymm = f"{(self.year + 1) % 100:02d}01"
-
-            filename = os.path.join(output_dir, f"{yymm}.svg")
-            svg_str = self._generate_calendar_svg(m)
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(svg_str)
-            print(f"Saved: {filename}")
+            if require_image:
+                jpg_filename = f"{self._yymm[m]}.jpg"
+                if not os.path.exists(os.path.join(output_dir, jpg_filename)):
+                    print(f"Skipped: {jpg_filename} not found")
+                    continue
+            months.append(m)
+
+        if max_workers is None:
+            for m in months:
+                filename = self._save_calendar_svg(m, output_dir)
+                print(f"Saved: {filename}")
+            return
+
+        # インスタンスごとワーカーに渡すので、インスタンス上の設定もそのまま使われる
+        n = len(months)
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            for filename in ex.map(_render_month, [self] * n, months, [output_dir] * n):
+                print(f"Saved: {filename}")
+
+    def _save_calendar_svg(self, month, output_dir):
+        filename = os.path.join(output_dir, f"{self._yymm[month]}.svg")
+        with open(filename, "w", encoding="utf-8", buffering=64 * 1024) as f:
+            self._generate_calendar_svg(f.write, month)
+        return filename
+
+
+def _render_month(gen, month, output_dir):
+    """
+    ProcessPoolExecutor のワーカー。1か月分の SVG を保存してファイル名を返す。
+    """
+    return gen._save_calendar_svg(month, output_dir)
 
 
 if __name__ == "__main__":